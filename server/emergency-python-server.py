@@ -7,45 +7,149 @@ This Python server provides an alternative HTTP server implementation
 to serve the Alfalyzer application when Node.js servers fail.
 """
 
+import email.utils
+import functools
+import gzip
 import http.server
-import socketserver
 import json
+import mmap
 import os
+import signal
+import socket
+import string
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 import threading
 import time
 
-class AlfalyzerHandler(http.server.SimpleHTTPRequestHandler):
-    """Custom handler for Alfalyzer emergency server"""
-    
-    def __init__(self, *args, **kwargs):
-        # Set the directory to serve files from
-        self.base_path = Path(__file__).parent.parent
-        self.dist_path = self.base_path / "dist" / "public"
-        self.client_public = self.base_path / "client" / "public"
-        
-        # Determine serving directory
-        if self.dist_path.exists():
-            os.chdir(self.dist_path)
-            print(f"📁 Serving from: {self.dist_path}")
-        elif self.client_public.exists():
-            os.chdir(self.client_public)
-            print(f"📁 Serving from: {self.client_public}")
-        else:
-            # Create temporary directory with basic files
-            temp_dir = self.base_path / "temp_public"
-            temp_dir.mkdir(exist_ok=True)
-            self.create_basic_files(temp_dir)
-            os.chdir(temp_dir)
-            print(f"📁 Serving from temporary: {temp_dir}")
-            
-        super().__init__(*args, **kwargs)
-    
-    def create_basic_files(self, temp_dir):
-        """Create basic HTML files for emergency serving"""
-        index_content = """
+# Optional fast path: when uvicorn + starlette are installed we serve the same
+# routes through an async, C-accelerated stack (uvloop/httptools are picked up
+# automatically by uvicorn when present). The stdlib server below stays as the
+# dependency-free fallback - this file must keep working when npm/node AND pip
+# installs have all failed.
+try:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.middleware.gzip import GZipMiddleware
+    from starlette.responses import JSONResponse
+    from starlette.routing import Mount, Route
+    from starlette.staticfiles import StaticFiles
+    HAS_ASGI = True
+except ImportError:
+    HAS_ASGI = False
+
+# Optional Rust JSON encoder - 5-6x faster than stdlib json and returns
+# bytes directly, so the hot API path skips a str.encode() allocation.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional brotli encoder for precompressed static assets; gzip from the
+# stdlib is always available as the baseline encoding.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Pretty-printed JSON roughly doubles output bytes and encode CPU, so it is
+# opt-in for debugging only
+JSON_PRETTY = os.environ.get('ALFALYZER_JSON_PRETTY') == '1'
+
+
+def json_bytes(payload):
+    """Serialize an API payload to UTF-8 bytes on the fastest encoder available"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if JSON_PRETTY else 0
+        return orjson.dumps(payload, option=option)
+    if JSON_PRETTY:
+        return json.dumps(payload, indent=2).encode()
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(second):
+    """Format an epoch second as ISO-8601 UTC bytes
+
+    Cached with maxsize=1: every request arriving within the same second
+    reuses one formatting call instead of paying for strftime each time.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second)).encode()
+
+
+def utc_timestamp_bytes():
+    """Current UTC time as ISO-8601 bytes, cached per second"""
+    return _format_timestamp(int(time.time()))
+
+
+def utc_timestamp():
+    """Current UTC time in the ISO-8601 format the Node servers emit"""
+    return utc_timestamp_bytes().decode()
+
+
+def health_payload(timestamp):
+    """Payload for /api/health"""
+    return {
+        'status': 'healthy',
+        'server': 'emergency-python-server',
+        'timestamp': timestamp,
+        'python_version': sys.version,
+        'platform': sys.platform
+    }
+
+
+def stocks_payload(timestamp):
+    """Payload for /api/stocks"""
+    return {
+        'message': 'Emergency Python server active',
+        'data': [
+            {'symbol': 'AAPL', 'price': 150.25, 'change': '+2.15'},
+            {'symbol': 'GOOGL', 'price': 2800.50, 'change': '-5.75'},
+            {'symbol': 'MSFT', 'price': 300.75, 'change': '+1.25'},
+            {'symbol': 'TSLA', 'price': 800.90, 'change': '+12.45'}
+        ],
+        'timestamp': timestamp,
+        'source': 'python-emergency-server'
+    }
+
+
+# Response bodies are serialized once at import and reused for every hit.
+# The timestamp placeholder has the same width as a real timestamp, so the
+# per-request splice never changes the body length and Content-Length can be
+# precomputed too.
+_TS_PLACEHOLDER = '0000-00-00T00:00:00Z'
+_TS_PLACEHOLDER_BYTES = _TS_PLACEHOLDER.encode()
+
+HEALTH_BODY_TEMPLATE = json_bytes(health_payload(_TS_PLACEHOLDER))
+STOCKS_BODY_TEMPLATE = json_bytes(stocks_payload(_TS_PLACEHOLDER))
+
+# Complete header blocks for the API routes, precomputed so each response
+# goes out as one socket write - headers and body in a single TCP segment
+# instead of the separate sends issued by send_header/end_headers.
+_HTTP_200 = b"HTTP/1.1 200 OK\r\n"
+_HTTP_404 = b"HTTP/1.1 404 Not Found\r\n"
+API_COMMON_HEADERS = (
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type, Authorization\r\n"
+    b"Access-Control-Max-Age: 86400\r\n"
+)
+HEALTH_RESPONSE_PREFIX = (
+    _HTTP_200 + API_COMMON_HEADERS
+    + b"Content-Length: %d\r\n\r\n" % len(HEALTH_BODY_TEMPLATE))
+STOCKS_RESPONSE_PREFIX = (
+    _HTTP_200 + API_COMMON_HEADERS
+    + b"Content-Length: %d\r\n\r\n" % len(STOCKS_BODY_TEMPLATE))
+
+
+# Fallback landing page, formatted once at startup. CSS braces rule out
+# str.format, so this is a string.Template with $-placeholders.
+INDEX_HTML_TEMPLATE = string.Template("""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -79,9 +183,9 @@ class AlfalyzerHandler(http.server.SimpleHTTPRequestHandler):
                 <div class="api-test">
                     <h3>Server Information</h3>
                     <pre id="server-info">
-Python Version: """ + sys.version + """
+Python Version: ${python_version}
 Server: Python HTTP Server (Emergency Mode)
-Directory: """ + str(Path.cwd()) + """
+Directory: ${serve_dir}
                     </pre>
                 </div>
             </div>
@@ -124,11 +228,173 @@ Directory: """ + str(Path.cwd()) + """
             </script>
         </body>
         </html>
-        """
-        
-        with open(temp_dir / "index.html", "w") as f:
-            f.write(index_content)
-    
+        """)
+
+
+def create_basic_files(temp_dir):
+    """Write the fallback index.html once; later calls are no-ops"""
+    index_file = temp_dir / "index.html"
+    if index_file.exists():
+        return
+    index_file.write_text(INDEX_HTML_TEMPLATE.substitute(
+        python_version=sys.version, serve_dir=str(temp_dir)))
+
+
+# Static assets worth precompressing, and the minimum size below which
+# compression does not pay for its own headers
+PRECOMPRESS_EXTENSIONS = {'.js', '.css', '.html', '.svg', '.json'}
+PRECOMPRESS_MIN_SIZE = 1024
+
+
+def precompress_assets(root):
+    """Write .gz (and .br when brotli is installed) siblings for text assets
+
+    Runs once at startup so compression cost never lands on the request
+    path; do_GET then negotiates Accept-Encoding against the siblings.
+    """
+    compressed = 0
+    for path in root.rglob('*'):
+        if path.suffix not in PRECOMPRESS_EXTENSIONS or not path.is_file():
+            continue
+        stat_result = path.stat()
+        if stat_result.st_size < PRECOMPRESS_MIN_SIZE:
+            continue
+
+        data = None
+        gz_path = path.with_name(path.name + '.gz')
+        if _needs_compression(gz_path, stat_result):
+            data = path.read_bytes()
+            gz_path.write_bytes(gzip.compress(data, compresslevel=9))
+            compressed += 1
+        if brotli is not None:
+            br_path = path.with_name(path.name + '.br')
+            if _needs_compression(br_path, stat_result):
+                if data is None:
+                    data = path.read_bytes()
+                br_path.write_bytes(brotli.compress(data, quality=11))
+                compressed += 1
+    if compressed:
+        print(f"🗜️  Precompressed {compressed} static asset variants")
+
+
+def _needs_compression(sibling, source_stat):
+    """True when a compressed sibling is missing or older than its source
+
+    The freshness check matters: after a rebuild, a stale sibling would
+    keep serving the old bundle to every compression-accepting client.
+    """
+    try:
+        return sibling.stat().st_mtime < source_stat.st_mtime
+    except OSError:
+        return True
+
+
+def resolve_serve_root():
+    """Pick the directory static files are served from"""
+    base_path = Path(__file__).parent.parent
+    dist_path = base_path / "dist" / "public"
+    client_public = base_path / "client" / "public"
+
+    if dist_path.exists():
+        return dist_path
+    if client_public.exists():
+        return client_public
+
+    # Create temporary directory with basic files
+    temp_dir = base_path / "temp_public"
+    temp_dir.mkdir(exist_ok=True)
+    create_basic_files(temp_dir)
+    return temp_dir
+
+
+# In-process cache of memory-mapped static assets, keyed by filesystem path.
+# Files above the threshold stay on the sendfile path so the cache does not
+# bloat resident memory.
+ASSET_CACHE = {}
+ASSET_CACHE_MAX_FILE_SIZE = 4 * 1024 * 1024
+
+
+class _MemoryFile:
+    """Read-only file over a cached memoryview, without copying the buffer
+
+    read() hands out slices of the shared mapping, so copyfile streams the
+    mapped pages straight to the socket. close() is a no-op because the
+    underlying view belongs to ASSET_CACHE, not to this reader.
+    """
+
+    def __init__(self, view):
+        self._view = view
+        self._pos = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self._view) - self._pos
+        chunk = self._view[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+
+def build_asset_cache(root):
+    """Memory-map the static assets so cached hits skip open/fstat/read"""
+    for path in root.rglob('*'):
+        if not path.is_file():
+            continue
+        stat_result = path.stat()
+        if not 0 < stat_result.st_size <= ASSET_CACHE_MAX_FILE_SIZE:
+            continue
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        ASSET_CACHE[str(path)] = (memoryview(mapped), stat_result)
+    if ASSET_CACHE:
+        print(f"🗄️  Memory-mapped {len(ASSET_CACHE)} static assets")
+
+
+# Resolved once at import. The handler used to re-stat the candidates and
+# os.chdir() on every request; besides the wasted syscalls, chdir is
+# process-global and unsafe under the threaded server.
+SERVE_ROOT = resolve_serve_root()
+
+
+class AlfalyzerServer(http.server.ThreadingHTTPServer):
+    """Threaded server so one slow client cannot stall everyone else"""
+
+    # Don't let in-flight request threads block shutdown, and allow
+    # rebinding a port that is still in TIME_WAIT after a restart.
+    # Deliberately no SO_REUSEPORT: the forked workers already balance via
+    # the shared inherited socket, and the option would let a second launch
+    # of this server silently bind an already-served port.
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class AlfalyzerHandler(http.server.SimpleHTTPRequestHandler):
+    """Custom handler for Alfalyzer emergency server"""
+
+    # Keep connections alive across requests to amortize TCP setup
+    protocol_version = "HTTP/1.1"
+
+    # TCP_NODELAY: never let Nagle hold back a small JSON response
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(SERVE_ROOT), **kwargs)
+
+    def copyfile(self, source, outputfile):
+        """Ship file contents with zero-copy sendfile(2) when possible"""
+        if outputfile is self.wfile and hasattr(source, 'fileno'):
+            try:
+                self.wfile.flush()
+                self.connection.sendfile(source)
+                return
+            except (OSError, ValueError):
+                # Socket or file did not support sendfile; use the
+                # buffered copy below instead
+                pass
+        super().copyfile(source, outputfile)
+
     def do_GET(self):
         """Handle GET requests"""
         parsed_path = urlparse(self.path)
@@ -140,49 +406,119 @@ Directory: """ + str(Path.cwd()) + """
             # Serve static files
             if parsed_path.path == '/' or parsed_path.path == '':
                 self.path = '/index.html'
+            accept_encoding = self.headers.get('Accept-Encoding', '')
+            if accept_encoding and self.serve_precompressed(accept_encoding):
+                return
             super().do_GET()
+
+    def send_head(self):
+        """Serve cached assets from memory, falling back to the disk path"""
+        fs_path = self.translate_path(self.path)
+        cached = ASSET_CACHE.get(fs_path)
+        if cached is None:
+            return super().send_head()
+        view, stat_result = cached
+
+        if self.is_unmodified(stat_result):
+            self.send_response(http.HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(fs_path))
+        self.send_header('Content-Length', str(stat_result.st_size))
+        self.send_header('Last-Modified',
+                         self.date_time_string(stat_result.st_mtime))
+        self.end_headers()
+        return _MemoryFile(view)
+
+    def is_unmodified(self, stat_result):
+        """If-Modified-Since check mirroring SimpleHTTPRequestHandler.send_head"""
+        if ('If-Modified-Since' not in self.headers
+                or 'If-None-Match' in self.headers):
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(
+                self.headers['If-Modified-Since'])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=timezone.utc)
+        if ims.tzinfo is not timezone.utc:
+            return False
+        last_modified = datetime.fromtimestamp(
+            stat_result.st_mtime, timezone.utc).replace(microsecond=0)
+        return last_modified <= ims
+
+    def serve_precompressed(self, accept_encoding):
+        """Serve a precompressed sibling (.br/.gz) the client accepts, if any"""
+        fs_path = self.translate_path(self.path)
+        if os.path.splitext(fs_path)[1] not in PRECOMPRESS_EXTENSIONS:
+            return False
+
+        accepted = {token.split(';', 1)[0].strip()
+                    for token in accept_encoding.split(',')}
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if encoding not in accepted:
+                continue
+            cached = ASSET_CACHE.get(fs_path + suffix)
+            if cached is not None:
+                view, stat_result = cached
+                self.send_compressed_headers(encoding, fs_path, stat_result)
+                self.wfile.write(view)
+                return True
+            try:
+                f = open(fs_path + suffix, 'rb')
+            except OSError:
+                continue
+            try:
+                self.send_compressed_headers(
+                    encoding, fs_path, os.fstat(f.fileno()))
+                self.copyfile(f, self.wfile)
+            finally:
+                f.close()
+            return True
+        return False
+
+    def send_compressed_headers(self, encoding, fs_path, stat_result):
+        """Send the response headers for a precompressed asset"""
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(fs_path))
+        self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(stat_result.st_size))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Last-Modified',
+                         self.date_time_string(stat_result.st_mtime))
+        self.end_headers()
     
     def handle_api_request(self, parsed_path):
         """Handle API requests"""
         path = parsed_path.path
-        
-        # Set CORS headers
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.end_headers()
-        
+
         if path == '/api/health':
-            response = {
-                'status': 'healthy',
-                'server': 'emergency-python-server',
-                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
-                'python_version': sys.version,
-                'platform': sys.platform
-            }
+            status = 200
+            prefix = HEALTH_RESPONSE_PREFIX
+            body = HEALTH_BODY_TEMPLATE.replace(
+                _TS_PLACEHOLDER_BYTES, utc_timestamp_bytes())
         elif path == '/api/stocks':
-            response = {
-                'message': 'Emergency Python server active',
-                'data': [
-                    {'symbol': 'AAPL', 'price': 150.25, 'change': '+2.15'},
-                    {'symbol': 'GOOGL', 'price': 2800.50, 'change': '-5.75'},
-                    {'symbol': 'MSFT', 'price': 300.75, 'change': '+1.25'},
-                    {'symbol': 'TSLA', 'price': 800.90, 'change': '+12.45'}
-                ],
-                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
-                'source': 'python-emergency-server'
-            }
+            status = 200
+            prefix = STOCKS_RESPONSE_PREFIX
+            body = STOCKS_BODY_TEMPLATE.replace(
+                _TS_PLACEHOLDER_BYTES, utc_timestamp_bytes())
         else:
-            self.send_response(404)
-            response = {
+            status = 404
+            body = json_bytes({
                 'error': 'API endpoint not found',
                 'path': path,
                 'server': 'emergency-python-server'
-            }
-        
-        self.wfile.write(json.dumps(response, indent=2).encode())
+            })
+            prefix = (_HTTP_404 + API_COMMON_HEADERS
+                      + b"Content-Length: %d\r\n\r\n" % len(body))
+
+        # The status line, headers and body leave in one write: wfile is
+        # unbuffered, so joining first is what makes it a single syscall
+        self.log_request(status)
+        self.wfile.write(prefix + body)
     
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS"""
@@ -190,15 +526,110 @@ Directory: """ + str(Path.cwd()) + """
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        # Let browsers cache the preflight for 24h instead of paying an
+        # extra OPTIONS round trip before every cross-origin request
+        self.send_header('Access-Control-Max-Age', '86400')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
+def create_asgi_app():
+    """Build a Starlette app mirroring AlfalyzerHandler's routes"""
+    async def health(request):
+        return JSONResponse(health_payload(utc_timestamp()))
+
+    async def stocks(request):
+        return JSONResponse(stocks_payload(utc_timestamp()))
+
+    async def api_not_found(request):
+        return JSONResponse({
+            'error': 'API endpoint not found',
+            'path': request.url.path,
+            'server': 'emergency-python-server'
+        }, status_code=404)
+
+    routes = [
+        Route('/api/health', health),
+        Route('/api/stocks', stocks),
+        Route('/api/{rest:path}', api_not_found),
+        Mount('/', StaticFiles(directory=str(SERVE_ROOT), html=True)),
+    ]
+    middleware = [
+        Middleware(
+            CORSMiddleware,
+            allow_origins=['*'],
+            allow_methods=['GET', 'POST', 'OPTIONS'],
+            allow_headers=['Content-Type', 'Authorization'],
+            max_age=86400,
+        ),
+        Middleware(GZipMiddleware, minimum_size=PRECOMPRESS_MIN_SIZE),
+    ]
+    return Starlette(routes=routes, middleware=middleware)
+
+
+def start_asgi_server(host, port):
+    """Serve through uvicorn; uvloop/httptools are used when installed"""
+    uvicorn.run(create_asgi_app(), host=host, port=port)
+
+
+def print_server_banner(host, port):
+    """Print the startup banner once a binding strategy succeeds"""
+    print(f"🚀 PYTHON EMERGENCY SERVER ACTIVE!")
+    print(f"📱 Local:    http://localhost:{port}")
+    print(f"🌐 Network:  http://{host}:{port}")
+    print(f"🔧 API:      http://localhost:{port}/api/health")
+    print(f"🔧 Stocks:   http://localhost:{port}/api/stocks")
+    print("=" * 60)
+    print("✅ Server is ready to accept connections")
+    print("Press Ctrl+C to stop the server")
+
+
+def fork_workers(httpd):
+    """Fork extra worker processes sharing the listening socket
+
+    The socket is bound once in the parent; forked children inherit it and
+    the kernel balances accepted connections across all processes, the same
+    model as `uvicorn --workers N`. Returns the child pids (empty when fork
+    is unsupported or prefork is disabled via ALFALYZER_WORKERS=1).
+    """
+    default_workers = os.cpu_count() or 1
+    try:
+        workers = int(os.environ.get('ALFALYZER_WORKERS', default_workers))
+    except ValueError:
+        print("⚠️  Ignoring non-numeric ALFALYZER_WORKERS")
+        workers = default_workers
+    if workers <= 1 or not hasattr(os, 'fork'):
+        return []
+
+    # Treat SIGTERM like Ctrl+C so the parent's cleanup also reaps the
+    # children when the process is terminated rather than interrupted
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    pids = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        pids.append(pid)
+    print(f"👥 {len(pids) + 1} worker processes accepting connections")
+    return pids
+
+
 def try_port(port, host='127.0.0.1'):
-    """Try to bind to a specific port and host"""
+    """Check port availability with a plain socket probe"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     try:
-        with socketserver.TCPServer((host, port), AlfalyzerHandler) as httpd:
-            return True
+        probe.bind((host, port))
+        return True
     except OSError:
         return False
+    finally:
+        probe.close()
 
 def find_available_port(start_port=3001, host='127.0.0.1'):
     """Find an available port starting from start_port"""
@@ -211,7 +642,14 @@ def start_server():
     """Start the Python emergency server with multiple binding strategies"""
     print("🐍 EMERGENCY PYTHON SERVER - ULTRATHINK PARALLEL EXECUTION")
     print("=" * 60)
-    
+
+    print(f"📁 Serving from: {SERVE_ROOT}")
+    # client/public is checked-in source rather than build output, so never
+    # litter it with generated .gz/.br siblings
+    if SERVE_ROOT != Path(__file__).parent.parent / "client" / "public":
+        precompress_assets(SERVE_ROOT)
+    build_asset_cache(SERVE_ROOT)
+
     # Try different ports and hosts
     strategies = [
         (3001, '127.0.0.1'),
@@ -227,28 +665,48 @@ def start_server():
     for port, host in strategies:
         try:
             print(f"🔄 Trying {host}:{port}...")
-            
-            # Test if port is available
-            if not try_port(port, host):
-                print(f"❌ Port {port} on {host} is not available")
-                continue
-            
+
+            # No separate availability probe: binding the real server below
+            # is the probe, and the except OSError handles a taken port.
+            # Probing first doubles the binds and leaves a window where
+            # another process can grab the port in between.
+
+            # Prefer the async C-accelerated stack when it is installed.
+            # uvicorn binds internally and exits the process on failure
+            # instead of raising OSError, which would kill the remaining
+            # strategies - so bind-probe the port first and translate a
+            # SystemExit that slips through into trying the next strategy.
+            if HAS_ASGI:
+                if not try_port(port, host):
+                    print(f"❌ Port {port} on {host} is not available")
+                    continue
+                print("⚡ uvicorn detected - serving through the ASGI fast path")
+                print_server_banner(host, port)
+                try:
+                    start_asgi_server(host, port)
+                except KeyboardInterrupt:
+                    print("\n🛑 Server stopping...")
+                except SystemExit:
+                    print(f"❌ Failed to bind to {host}:{port} - uvicorn exited")
+                    continue
+                break
+
             # Start the server
-            with socketserver.TCPServer((host, port), AlfalyzerHandler) as httpd:
-                print(f"🚀 PYTHON EMERGENCY SERVER ACTIVE!")
-                print(f"📱 Local:    http://localhost:{port}")
-                print(f"🌐 Network:  http://{host}:{port}")
-                print(f"🔧 API:      http://localhost:{port}/api/health")
-                print(f"🔧 Stocks:   http://localhost:{port}/api/stocks")
-                print("=" * 60)
-                print("✅ Server is ready to accept connections")
-                print("Press Ctrl+C to stop the server")
-                
+            with AlfalyzerServer((host, port), AlfalyzerHandler) as httpd:
+                print_server_banner(host, port)
+                worker_pids = fork_workers(httpd)
+
                 try:
                     httpd.serve_forever()
                 except KeyboardInterrupt:
                     print("\n🛑 Server stopping...")
                     break
+                finally:
+                    for pid in worker_pids:
+                        try:
+                            os.kill(pid, signal.SIGTERM)
+                        except ProcessLookupError:
+                            pass
                     
         except OSError as e:
             print(f"❌ Failed to bind to {host}:{port} - {e}")